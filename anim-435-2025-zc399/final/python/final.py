@@ -15,6 +15,15 @@ Buttons:
                    matching locator positions each run (no duplicates)
 [Bind] (extra)   - Binds all geometry under GRP_geom to the joints under GRP_rig
 
+Usage (Script Editor) - importing has no side effects, the window opens on show_ui():
+    from final import show_ui
+    show_ui()                                  # LOC_root / JNT_root ...
+
+    import final
+    final.show_ui(final.AssetScopedNaming())   # LOC_<ASSET>_root / JNT_<ASSET>_root ...
+
+Usage (batch): mayapy final.py --headless --asset trex [--naming asset] [--scene in.ma] [--output out.ma]
+
 Doc refs used by this implementation:
 - os.getenv (env vars): https://docs.python.org/3/library/os.html#os.getenv
 - cmds.xform (query/set transforms): https://help.autodesk.com/cloudhelp/CHS/MayaCRE-Tech-Docs/Commands/xform.html
@@ -23,9 +32,19 @@ Doc refs used by this implementation:
 - Maya Python workflow guidance: https://www.chadvernon.com/python-scripting-for-maya-artists/
 """
 
+from __future__ import annotations
+
 import os
+import abc
+import argparse
 import logging
+import hashlib
+import functools
+import contextlib
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 
 # -----------------------------
 # Logging
@@ -41,201 +60,381 @@ LOG.setLevel(logging.INFO)
 # Constants / naming
 # -----------------------------
 WIN = "PropRigToolWin"
-
-def _asset_name():
-    """Read ASSET from environment. (Python os.getenv docs: https://docs.python.org/3/library/os.html#os.getenv)"""
-    name = os.getenv("ASSET")
+BIND_HASH_ATTR = "bindHash"    # string attr on GRP_<ASSET>: hash of the joints + meshes currently bound
+BIND_SKINS_ATTR = "bindSkins"  # string attr on GRP_<ASSET>: comma-separated skinClusters behind that hash
+
+class Naming(abc.ABC):
+    """Node names for one rig. Group names are shared; subclasses decide the locator/joint names."""
+    def grp_names(self, asset: str) -> tuple[str, str, str]:
+        return f"GRP_{asset}", "GRP_geom", "GRP_rig"
+
+    @abc.abstractmethod
+    def loc_names(self, asset: str) -> tuple[str, str, str]:
+        ...
+
+    @abc.abstractmethod
+    def jnt_names(self, asset: str) -> tuple[str, str, str]:
+        ...
+
+class GlobalNaming(Naming):
+    """LOC_root / JNT_root ... (one prop rig per scene)."""
+    def loc_names(self, asset: str) -> tuple[str, str, str]:
+        return "LOC_root", "LOC_base", "LOC_move"
+
+    def jnt_names(self, asset: str) -> tuple[str, str, str]:
+        return "JNT_root", "JNT_base", "JNT_move"
+
+class AssetScopedNaming(Naming):
+    """LOC_<ASSET>_root / JNT_<ASSET>_root ... (several prop rigs can share a scene)."""
+    def loc_names(self, asset: str) -> tuple[str, str, str]:
+        return f"LOC_{asset}_root", f"LOC_{asset}_base", f"LOC_{asset}_move"
+
+    def jnt_names(self, asset: str) -> tuple[str, str, str]:
+        return f"JNT_{asset}_root", f"JNT_{asset}_base", f"JNT_{asset}_move"
+
+NAMING = {"global": GlobalNaming, "asset": AssetScopedNaming}
+
+@dataclass
+class _Context:
+    """Paths resolved by [Create Group], reused by the other buttons for the rest of the UI session."""
+    root: str = ""
+    geom_path: str = ""
+    rig_path: str = ""
+    asset: str = ""  # --asset from the command line; overrides the ASSET env var
+    naming: Naming = field(default_factory=GlobalNaming)
+
+_CTX = _Context()
+
+@functools.lru_cache(maxsize=1)
+def _asset_name() -> str:
+    """Read ASSET from --asset or the environment. (Python os.getenv docs: https://docs.python.org/3/library/os.html#os.getenv)"""
+    name = _CTX.asset or os.getenv("ASSET")
     if not name:
         LOG.warning("ASSET env var not set. Using fallback 'defaultAsset'. (Set in Git Bash: export ASSET=trex)")
         name = "defaultAsset"
     return name
 
-def _grp_names(asset):
-    root = f"GRP_{asset}"
-    geom = "GRP_geom"
-    rig  = "GRP_rig"
-    return root, geom, rig
+@functools.lru_cache(maxsize=1)
+def _grp_names(asset: str) -> tuple[str, str, str]:
+    return _CTX.naming.grp_names(asset)
 
-def _loc_names():
-    return "LOC_root", "LOC_base", "LOC_move"
+def _paths() -> tuple[str, str, str]:
+    """Return (root, geom_path, rig_path), from _CTX if [Create Group] already filled it."""
+    if not _CTX.root:
+        root, geom, rig = _grp_names(_asset_name())
+        _CTX.root, _CTX.geom_path, _CTX.rig_path = root, f"{root}|{geom}", f"{root}|{rig}"
+    return _CTX.root, _CTX.geom_path, _CTX.rig_path
+
+def _loc_names() -> tuple[str, str, str]:
+    return _CTX.naming.loc_names(_asset_name())
+
+def _jnt_names() -> tuple[str, str, str]:
+    return _CTX.naming.jnt_names(_asset_name())
+
+def _exists_many(names: Iterable[str]) -> dict[str, bool]:
+    """
+    Existence check for several nodes at once (replaces repeated cmds.objExists calls).
+    Uses one API 2.0 MSelectionList: https://help.autodesk.com/view/MAYAUL/2025/ENU/?guid=Maya_SDK_py_ref_class_open_maya_1_1_m_selection_list_html
+    Returns {name: True/False}.
+    """
+    sl = om.MSelectionList()
+    found = {}
+    for n in names:
+        try:
+            sl.add(n)
+            found[n] = True
+        except RuntimeError:
+            found[n] = False
+    return found
+
+def _get_dag(name: str) -> om.MDagPath:
+    """Resolve a node name to an MDagPath (one MSelectionList lookup, no command dispatch)."""
+    sl = om.MSelectionList()
+    sl.add(name)
+    return sl.getDagPath(0)
+
+def _child_paths(dag: om.MDagPath) -> set[str]:
+    """Full paths of the direct children of dag, walked with MFnDagNode instead of cmds.listRelatives."""
+    fn = om.MFnDagNode(dag)
+    return {om.MFnDagNode(fn.child(i)).fullPathName() for i in range(fn.childCount())}
+
+def _get_t(dag: om.MDagPath) -> om.MVector:
+    """World-space translation as an MVector (MFnTransform: https://help.autodesk.com/view/MAYAUL/2025/ENU/?guid=Maya_SDK_py_ref_class_open_maya_1_1_m_fn_transform_html)"""
+    return om.MFnTransform(dag).translation(om.MSpace.kWorld)
+
+def _set_t(name: str, v: om.MVector) -> None:
+    """Set world-space translation through cmds.xform so the move stays on Maya's undo queue."""
+    cmds.xform(name, worldSpace=True, translation=(v.x, v.y, v.z))
+
+@contextlib.contextmanager
+def _fast_maya() -> Iterator[None]:
+    """
+    Suspend viewport refresh and switch the evaluation manager off while a button runs,
+    so the DAG edits don't trigger a redraw/evaluation each step. Restores both afterwards.
+    (evaluationManager doc: https://help.autodesk.com/cloudhelp/2025/ENU/Maya-Tech-Docs/CommandsPython/evaluationManager.html)
+    """
+    old = (cmds.evaluationManager(query=True, mode=True) or ["off"])[0]
+    cmds.refresh(suspend=True)
+    if old != "off":
+        cmds.evaluationManager(mode="off")
+    try:
+        yield
+    finally:
+        cmds.refresh(suspend=False)
+        if old != "off":
+            cmds.evaluationManager(mode=old)
+        cmds.refresh()
 
-def _jnt_names():
-    return "JNT_root", "JNT_base", "JNT_move"
+def _bind_hash(joints: list[str], geos: list[str]) -> str:
+    """sha1 of the joints + sorted mesh paths, stored on GRP_<ASSET> to detect an unchanged bind."""
+    return hashlib.sha1(",".join(joints + sorted(geos)).encode("utf-8")).hexdigest()
 
 # -----------------------------
 # Core actions
 # -----------------------------
 def create_group(*_):
-    asset = _asset_name()
-    root, geom, rig = _grp_names(asset)
-
-    # Create root group if needed
-    if not cmds.objExists(root):
-        root = cmds.group(empty=True, name=root)
-        LOG.info(f"Created {root}")
-    else:
-        LOG.info(f"{root} already exists (no duplicate created).")
-
-    # Ensure child groups exist under root (exact names required by spec)
-    geom_path = f"{root}|{geom}"
-    rig_path  = f"{root}|{rig}"
-
-    if not cmds.objExists(geom_path):
-        cmds.group(empty=True, name=geom, parent=root)
-        LOG.info(f"Created {geom_path}")
-    if not cmds.objExists(rig_path):
-        cmds.group(empty=True, name=rig, parent=root)
-        LOG.info(f"Created {rig_path}")
-
-    # Move selected geometry under GRP_geom
-    sel = cmds.ls(selection=True, long=True) or []
-    if not sel:
-        LOG.warning("No selection found. Nothing was moved into GRP_geom.")
-        return
-
-    # Parent only transforms (avoid shape nodes)
-    moved = 0
-    for node in sel:
-        xform = node
-        if cmds.nodeType(node) != "transform":
-            parents = cmds.listRelatives(node, parent=True, fullPath=True) or []
-            if parents:
-                xform = parents[0]
-
-        if cmds.objExists(xform):
-            try:
-                cmds.parent(xform, geom_path)
-                moved += 1
-            except Exception as e:
-                LOG.warning(f"Could not parent {xform} under {geom_path}: {e}")
+    with _fast_maya():
+        asset = _asset_name()
+        root, geom, rig = _grp_names(asset)
+        geom_path = f"{root}|{geom}"
+        rig_path  = f"{root}|{rig}"
+        exists = _exists_many((root, geom_path, rig_path))
+
+        # Create root group if needed
+        if not exists[root]:
+            root = cmds.group(empty=True, name=root)
+            LOG.info("Created %s", root)
+        else:
+            LOG.info("%s already exists (no duplicate created).", root)
+
+        # Ensure child groups exist under root (exact names required by spec)
+        if not exists[geom_path]:
+            cmds.group(empty=True, name=geom, parent=root)
+            LOG.info("Created %s", geom_path)
+        if not exists[rig_path]:
+            cmds.group(empty=True, name=rig, parent=root)
+            LOG.info("Created %s", rig_path)
+        _CTX.root, _CTX.geom_path, _CTX.rig_path = root, geom_path, rig_path
+        geom_dag = _get_dag(geom_path)
+        rig_dag = _get_dag(rig_path)
+
+        # Move selected geometry under GRP_geom
+        # Parent only transforms: selected transforms plus the parents of selected shapes/components,
+        # each gathered with one filtered ls/listRelatives call (deduped by full path via the sets)
+        sel_tfm = set(cmds.ls(selection=True, long=True, type="transform") or [])
+        sel_shapes = cmds.ls(selection=True, long=True, objectsOnly=True, shapes=True) or []
+        shape_parents = set(cmds.listRelatives(sel_shapes, parent=True, fullPath=True) or []) if sel_shapes else set()
+        xforms = sorted(sel_tfm | shape_parents)
+        if not xforms:
+            LOG.warning("No selection found. Nothing was moved into GRP_geom.")
+            return
+
+        # Skip items already under GRP_geom, the rig groups themselves and anything inside GRP_rig.
+        # Compared against full DAG paths, since ls(long=True) returns "|GRP_<ASSET>|..." paths.
+        geom_full = geom_dag.fullPathName()
+        rig_full = rig_dag.fullPathName()
+        root_full = geom_full.rsplit("|", 1)[0]
+        already = _child_paths(geom_dag)
+        # Also skip nodes whose ancestor is selected too, so they move along inside their group.
+        selected = xforms
+        xforms = [x for x in selected
+                  if x not in already
+                  and x not in (root_full, geom_full, rig_full)
+                  and not geom_full.startswith(x + "|")
+                  and not x.startswith(rig_full + "|")
+                  and not any(x.startswith(y + "|") for y in selected)]
+        if not xforms:
+            LOG.info("Nothing new to move under %s", geom_path)
+            return
 
-    LOG.info(f"Moved {moved} item(s) under {geom_path}")
+        # One batched parent call (parent doc: https://help.autodesk.com/cloudhelp/2025/ENU/Maya-Tech-Docs/CommandsPython/parent.html)
+        # No objExists pre-check: cmds.parent raises RuntimeError (or ValueError for a missing node), and only then
+        # do we fall back to one call per node so the valid ones still move.
+        moved = 0
+        target = geom_full
+        cmds.undoInfo(openChunk=True)
+        try:
+            moved = len(cmds.parent(*xforms, target) or [])
+        except (RuntimeError, ValueError):
+            for xform in xforms:
+                try:
+                    cmds.parent(xform, target)
+                    moved += 1
+                except (RuntimeError, ValueError) as e:
+                    LOG.warning("Could not parent %s under %s: %s", xform, geom_path, e)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        LOG.info("Moved %s item(s) under %s", moved, geom_path)
 
 def place_locators(*_):
-    asset = _asset_name()
-    root, geom, rig = _grp_names(asset)
+    with _fast_maya():
+        root, geom_path, rig_path = _paths()
+        loc_root, loc_base, loc_move = _loc_names()
+        exists = _exists_many((root, loc_root, loc_base, loc_move))
 
-    if not cmds.objExists(root):
-        LOG.error(f"{root} does not exist. Run [Create Group] first.")
-        return
+        if not exists[root]:
+            LOG.error("%s does not exist. Run [Create Group] first.", root)
+            return
 
-    loc_root, loc_base, loc_move = _loc_names()
+        # Place locators at the root group pivot
+        pivot = om.MVector(om.MFnTransform(_get_dag(root)).rotatePivot(om.MSpace.kWorld))
 
-    # Place locators at the root group pivot (xform doc: https://help.autodesk.com/cloudhelp/CHS/MayaCRE-Tech-Docs/Commands/xform.html)
-    pivot = cmds.xform(root, query=True, worldSpace=True, rotatePivot=True)
+        locs = (loc_root, loc_base, loc_move)
+        for loc in locs:
+            if not exists[loc]:
+                cmds.spaceLocator(name=loc)
+                LOG.info("Created %s", loc)
 
-    for loc in (loc_root, loc_base, loc_move):
-        if not cmds.objExists(loc):
-            cmds.spaceLocator(name=loc)
-            LOG.info(f"Created {loc}")
-        cmds.xform(loc, worldSpace=True, translation=pivot)
+        # One xform call positions all three (xform doc: https://help.autodesk.com/cloudhelp/CHS/MayaCRE-Tech-Docs/Commands/xform.html)
+        cmds.xform(*locs, worldSpace=True, translation=(pivot.x, pivot.y, pivot.z))
 
-    LOG.info("Locators placed. Artist can now move LOC_root / LOC_base / LOC_move by hand.")
+        LOG.info("Locators placed. Artist can now move %s / %s / %s by hand.", loc_root, loc_base, loc_move)
 
 def build_rig(*_):
-    asset = _asset_name()
-    root, geom, rig = _grp_names(asset)
-    rig_path = f"{root}|{rig}"
-
-    if not cmds.objExists(rig_path):
-        LOG.error(f"{rig_path} does not exist. Run [Create Group] first.")
-        return
-
-    loc_root, loc_base, loc_move = _loc_names()
-    for loc in (loc_root, loc_base, loc_move):
-        if not cmds.objExists(loc):
-            LOG.error(f"{loc} not found. Run [Place Locators] first.")
-            return
-
-    jnt_root, jnt_base, jnt_move = _jnt_names()
-
-    # Query locator positions
-    p_root = cmds.xform(loc_root, query=True, worldSpace=True, translation=True)
-    p_base = cmds.xform(loc_base, query=True, worldSpace=True, translation=True)
-    p_move = cmds.xform(loc_move, query=True, worldSpace=True, translation=True)
+    with _fast_maya():
+        root, geom_path, rig_path = _paths()
 
-    # Create or update joints (joint doc: https://download.autodesk.com/us/maya/2010help/commandspython/joint.html)
-    # Rule: no duplicates; if joint exists, move it. If not, create it.
+        loc_root, loc_base, loc_move = _loc_names()
+        jnt_root, jnt_base, jnt_move = _jnt_names()
+        exists = _exists_many((rig_path, loc_root, loc_base, loc_move, jnt_root, jnt_base, jnt_move))
 
-    def _ensure_joint(name, pos):
-        if cmds.objExists(name):
-            cmds.xform(name, worldSpace=True, translation=pos)
-            LOG.info(f"Moved {name} to locator position.")
-            return name
-        cmds.select(clear=True)
-        j = cmds.joint(name=name, position=pos)
-        LOG.info(f"Created {j}")
-        return j
-
-    jr = _ensure_joint(jnt_root, p_root)
-    jb = _ensure_joint(jnt_base, p_base)
-    jm = _ensure_joint(jnt_move, p_move)
+        if not exists[rig_path]:
+            LOG.error("%s does not exist. Run [Create Group] first.", rig_path)
+            return
 
-    # Ensure hierarchy JNT_root -> JNT_base -> JNT_move
-    # Parent carefully (avoid breaking if already correct)
-    try:
-        if cmds.listRelatives(jb, parent=True) != [jr]:
-            cmds.parent(jb, jr)
-        if cmds.listRelatives(jm, parent=True) != [jb]:
-            cmds.parent(jm, jb)
-    except Exception as e:
-        LOG.warning(f"Parenting joints failed: {e}")
-
-    # Ensure the chain lives under GRP_rig (not under world)
-    try:
-        if cmds.listRelatives(jr, parent=True, fullPath=True) != [rig_path]:
-            cmds.parent(jr, rig_path)
-    except Exception as e:
-        LOG.warning(f"Parenting {jr} under {rig_path} failed: {e}")
+        for loc in (loc_root, loc_base, loc_move):
+            if not exists[loc]:
+                LOG.error("%s not found. Run [Place Locators] first.", loc)
+                return
+
+        # Query locator positions (one MDagPath per locator, no xform command dispatch)
+        p_root = _get_t(_get_dag(loc_root))
+        p_base = _get_t(_get_dag(loc_base))
+        p_move = _get_t(_get_dag(loc_move))
+
+        # Create or update joints (joint doc: https://download.autodesk.com/us/maya/2010help/commandspython/joint.html)
+        # Rule: no duplicates; if joint exists, move it. If not, create it.
+        # New joints are created with their parent selected, so they land in the hierarchy
+        # at the absolute locator position in one call (no separate parent/xform).
+
+        def _ensure_joint(name: str, pos: om.MVector, parent: str) -> str:
+            if exists[name]:
+                _set_t(name, pos)
+                LOG.info("Moved %s to locator position.", name)
+                return name
+            cmds.select(parent, replace=True)
+            j = cmds.joint(name=name, position=(pos.x, pos.y, pos.z), absolute=True)
+            LOG.info("Created %s", j)
+            return j
+
+        jr = _ensure_joint(jnt_root, p_root, rig_path)
+        jb = _ensure_joint(jnt_base, p_base, jr)
+        jm = _ensure_joint(jnt_move, p_move, jb)
+
+        # Ensure hierarchy GRP_rig -> JNT_root -> JNT_base -> JNT_move (only pre-existing joints can be off)
+        # Current parents come from MFnDagNode on the resolved paths; only joints that are off get reparented.
+        desired = ((jr, rig_path), (jb, jr), (jm, jb))
+        changed = [(child, parent) for child, parent in desired
+                   if om.MFnDagNode(_get_dag(child)).parent(0) != _get_dag(parent).node()]
+        for child, parent in changed:
+            try:
+                cmds.parent(child, parent)
+            except (RuntimeError, ValueError) as e:
+                LOG.warning("Parenting %s under %s failed: %s", child, parent, e)
 
-    LOG.info(f"Rig built/updated under {rig_path}. Press [Build Rig] again after moving locators to update.")
+        LOG.info("Rig built/updated under %s. Press [Build Rig] again after moving locators to update.", rig_path)
 
 def bind_geom(*_):
     """
     Extra credit: Bind all geometry under GRP_geom to the skeleton in GRP_rig.
     Uses skinCluster concept: https://help.autodesk.com/cloudhelp/2018/CHS/Maya-Tech-Docs/PyMel/generated/classes/pymel.core.nodetypes/pymel.core.nodetypes.SkinCluster.html
     """
-    asset = _asset_name()
-    root, geom, rig = _grp_names(asset)
-    geom_path = f"{root}|{geom}"
-    rig_path  = f"{root}|{rig}"
-
-    if not cmds.objExists(geom_path) or not cmds.objExists(rig_path):
-        LOG.error("Groups missing. Run [Create Group] first.")
-        return
-
-    jnt_root, jnt_base, jnt_move = _jnt_names()
-    for j in (jnt_root, jnt_base, jnt_move):
-        if not cmds.objExists(j):
-            LOG.error("Joints missing. Run [Build Rig] first.")
+    with _fast_maya():
+        root, geom_path, rig_path = _paths()
+
+        jnt_root, jnt_base, jnt_move = _jnt_names()
+        exists = _exists_many((geom_path, rig_path, jnt_root, jnt_base, jnt_move))
+
+        if not exists[geom_path] or not exists[rig_path]:
+            LOG.error("Groups missing. Run [Create Group] first.")
             return
 
-    # Gather transforms under GRP_geom that have mesh shapes
-    candidates = cmds.listRelatives(geom_path, allDescendents=True, fullPath=True, type="transform") or []
-    geos = []
-    for t in candidates:
-        shapes = cmds.listRelatives(t, shapes=True, fullPath=True) or []
-        if any(cmds.nodeType(s) == "mesh" for s in shapes):
-            geos.append(t)
+        for j in (jnt_root, jnt_base, jnt_move):
+            if not exists[j]:
+                LOG.error("Joints missing. Run [Build Rig] first.")
+                return
 
-    if not geos:
-        LOG.warning("No mesh geometry found under GRP_geom to bind.")
-        return
+        # Gather transforms under GRP_geom that have mesh shapes (one ls walk, parents derived from the shape paths)
+        # Type and intermediate-object filtering happen inside ls, so "Orig" shapes never reach Python.
+        meshes = cmds.ls(geom_path, dag=True, long=True, type="mesh", noIntermediate=True) or []
+        # Sorted so bind order (and skinCluster names) don't depend on DAG insertion order
+        geos = sorted(set(m.rsplit("|", 1)[0] for m in meshes))
 
-    # Bind
-    try:
-        cmds.select(clear=True)
-        cmds.select([jnt_root, jnt_base, jnt_move] + geos)
-        # Typical smooth bind call:
-        cmds.skinCluster(toSelectedBones=True)
-        LOG.info(f"Bound {len(geos)} mesh transform(s) to joints.")
-    except Exception as e:
-        LOG.error(f"Bind failed: {e}")
+        if not geos:
+            LOG.warning("No mesh geometry found under GRP_geom to bind.")
+            return
+
+        # Skip the rebind if exactly these joints + meshes are bound and their skinClusters are still there
+        joints = [jnt_root, jnt_base, jnt_move]
+        hash_plug = f"{root}.{BIND_HASH_ATTR}"
+        skins_plug = f"{root}.{BIND_SKINS_ATTR}"
+        has_hash = cmds.attributeQuery(BIND_HASH_ATTR, node=root, exists=True)
+        has_skins = cmds.attributeQuery(BIND_SKINS_ATTR, node=root, exists=True)
+        if has_hash and has_skins and cmds.getAttr(hash_plug) == _bind_hash(joints, geos):
+            stored = [n for n in (cmds.getAttr(skins_plug) or "").split(",") if n]
+            if all(_exists_many(stored).values()):
+                LOG.info("Geometry under %s unchanged since last bind. Nothing to do.", geom_path)
+                return
+
+        # Bind each mesh with its own skinCluster (smaller weight solves, GPU-deformer friendly),
+        # all inside one undo chunk so a single undo reverts the whole bind.
+        # Meshes that already have a skinCluster are kept as-is; only new ones get bound.
+        skinned = {}  # mesh transform -> skinCluster name Maya actually uses
+        cmds.undoInfo(openChunk=True)
+        try:
+            joint_names = {j.rsplit("|", 1)[-1] for j in joints}
+            for g in geos:
+                # Guard the empty case: ls([]) means "no filter" and would return every skinCluster in the scene
+                hist = cmds.listHistory(g, pruneDagObjects=True)
+                existing = cmds.ls(hist, type="skinCluster") if hist else []
+                if existing:
+                    influences = cmds.skinCluster(existing[0], query=True, influence=True) or []
+                    if joint_names <= {i.rsplit("|", 1)[-1] for i in influences}:
+                        skinned[g] = existing[0]
+                    else:
+                        LOG.warning("%s is already skinned by %s to other joints. Skipped.", g, existing[0])
+                    continue
+                try:
+                    skinned[g] = cmds.skinCluster(*joints, g, toSelectedBones=True,
+                                                  name=f"skn_{g.rsplit('|', 1)[-1]}")[0]
+                    LOG.info("Bound %s (%s)", g, skinned[g])
+                except RuntimeError as e:
+                    LOG.error("Bind failed for %s: %s", g, e)
+
+            # Record what is actually bound, so a later Bind only skips when nothing changed
+            if not has_hash:
+                cmds.addAttr(root, longName=BIND_HASH_ATTR, dataType="string")
+            if not has_skins:
+                cmds.addAttr(root, longName=BIND_SKINS_ATTR, dataType="string")
+            bound = sorted(skinned)
+            cmds.setAttr(hash_plug, _bind_hash(joints, bound), type="string")
+            cmds.setAttr(skins_plug, ",".join(skinned[g] for g in bound), type="string")
+        finally:
+            cmds.undoInfo(closeChunk=True)
+        LOG.info("%s of %s mesh transform(s) bound to joints.", len(skinned), len(geos))
 
 # -----------------------------
 # UI
 # -----------------------------
-def show_ui(*_):
+def show_ui(naming: Optional[Naming] = None) -> None:
+    """Open the tool window. naming: a Naming instance (defaults to the current one, GlobalNaming at first)."""
+    global _CTX
+    # Re-opening the window picks up ASSET / naming changes
+    _CTX = _Context(asset=_CTX.asset, naming=naming or _CTX.naming)
+    _asset_name.cache_clear()
+    _grp_names.cache_clear()
+
     if cmds.window(WIN, exists=True):
         cmds.deleteUI(WIN)
 
@@ -253,4 +452,52 @@ def show_ui(*_):
     cmds.showWindow(WIN)
     LOG.info("UI opened. Workflow: Create Group → Place Locators → (artist moves locators) → Build Rig.")
 
-show_ui()
+# -----------------------------
+# Command line / batch (mayapy)
+# -----------------------------
+def _ensure_maya() -> None:
+    """Initialize maya.standalone only when no Maya session is running (e.g. `mayapy final.py`)."""
+    try:
+        cmds.about(version=True)
+    except (AttributeError, RuntimeError):
+        import maya.standalone
+        maya.standalone.initialize()
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """argparse docs: https://docs.python.org/3/library/argparse.html"""
+    p = argparse.ArgumentParser(description="Prop Rig Generating Tool")
+    p.add_argument("--asset", default=os.getenv("ASSET"), help="asset name (defaults to the ASSET env var)")
+    p.add_argument("--naming", choices=sorted(NAMING), default="global",
+                   help="global: LOC_root/JNT_root, asset: LOC_<ASSET>_root/JNT_<ASSET>_root")
+    p.add_argument("--headless", action="store_true", help="build group, locators and rig without opening the UI")
+    p.add_argument("--scene", help="scene to open before building (headless only)")
+    p.add_argument("--output", help="path to save the result to (headless only)")
+    # parse_known_args: tolerate extra args Maya may leave in sys.argv when run from the Script Editor
+    return p.parse_known_args(argv)[0]
+
+def _run_headless(args: argparse.Namespace) -> None:
+    """Run Create Group -> Place Locators -> Build Rig with no UI, then optionally save."""
+    if args.scene:
+        cmds.file(args.scene, open=True, force=True)
+    create_group()
+    place_locators()
+    build_rig()
+    if args.output:
+        cmds.file(rename=args.output)
+        cmds.file(save=True, type="mayaAscii" if args.output.endswith(".ma") else "mayaBinary")
+        LOG.info("Saved %s", args.output)
+
+def _main(argv: Optional[list[str]] = None) -> None:
+    args = _parse_args(argv)
+    _ensure_maya()
+    _CTX.asset = args.asset or ""
+    _CTX.naming = NAMING[args.naming]()
+    _asset_name.cache_clear()
+    _grp_names.cache_clear()
+    if args.headless:
+        _run_headless(args)
+    elif not cmds.about(batch=True):
+        show_ui()
+
+if __name__ == "__main__":
+    _main()